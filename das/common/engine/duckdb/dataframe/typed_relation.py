@@ -1,7 +1,7 @@
 from typing import Self, TypeVar
 
 import duckdb
-import pandas as pd
+import pyarrow as pa
 from pandera.errors import SchemaError
 from pandera.pandas import DataFrameModel
 
@@ -39,7 +39,9 @@ class TypedRelation(TypedDataFrameBase, abstract=True):
 
     @classmethod
     def from_dicts(cls, dicts: list[dict]) -> Self:
-        return cls.from_relation(duckdb.from_df(pd.DataFrame(dicts)))
+        # pa.array unifies keys across all rows; missing keys become nulls
+        table = pa.Table.from_struct_array(pa.array(dicts))
+        return cls.from_relation(duckdb.from_arrow(table))
 
     def with_columns(self, **named_exprs: duckdb.Expression) -> duckdb.DuckDBPyRelation:
         """
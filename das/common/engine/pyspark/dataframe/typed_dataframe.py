@@ -4,6 +4,7 @@ from pyspark.errors.exceptions.base import PySparkAssertionError
 from pyspark.sql import DataFrame as SparkDataFrame
 from pyspark.sql import SparkSession
 from pyspark.sql.column import Column as SparkColumn
+from pyspark.sql.types import StructType
 from pyspark.testing import assertSchemaEqual
 from sparkdantic import SparkModel
 
@@ -33,6 +34,7 @@ class TypedDataFrame(TypedDataFrameBase, abstract=True):
     DataFrameModel = SparkModel
     SchemaError = PySparkAssertionError
     _schema_class: ClassVar[type[SparkModel]]
+    _spark_schema: ClassVar[StructType]
 
     @classmethod
     def from_df(
@@ -49,9 +51,12 @@ class TypedDataFrame(TypedDataFrameBase, abstract=True):
         return cls(df)
 
     @classmethod
-    def as_spark_schema(cls):
+    def as_spark_schema(cls) -> StructType:
         """Generate PySpark StructType schema from the TypedDataFrame definition."""
-        return cls._schema_class.model_spark_schema(safe_casting=True)
+        # look up in the class's own namespace so subclasses don't reuse the parent schema
+        if "_spark_schema" not in cls.__dict__:
+            cls._spark_schema = cls._schema_class.model_spark_schema(safe_casting=True)
+        return cls._spark_schema
 
     @classmethod
     def from_dicts(cls, dicts: list[dict]) -> Self:
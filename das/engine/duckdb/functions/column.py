@@ -1,16 +1,19 @@
+from collections.abc import Iterable
+
 from duckdb import Expression
 from duckdb.typing import VARCHAR
 
-from .common import Case, false, true
+from .common import Case, Lit, false, true
 
 
 def map_to_boolean(
-    col: Expression, to_true: list[str] | str, to_false: list[str] | str
+    col: Expression, to_true: Iterable[str] | str, to_false: Iterable[str] | str
 ) -> Expression:
     """Map the boolean-like string-values to actual boolean."""
     to_true = [to_true] if isinstance(to_true, str) else to_true
     to_false = [to_false] if isinstance(to_false, str) else to_false
-    mapped = Case(col.cast(VARCHAR).isin(to_true), true).when(
-        col.cast(VARCHAR).isin(to_false), false
+    col_as_str = col.cast(VARCHAR)
+    mapped = Case(col_as_str.isin(*[Lit(v) for v in to_true]), true).when(
+        col_as_str.isin(*[Lit(v) for v in to_false]), false
     )
     return mapped.alias(col.get_name())
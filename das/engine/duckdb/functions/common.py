@@ -1,9 +1,13 @@
+from duckdb import CaseExpression as Case
+from duckdb import CoalesceOperator as Coalesce
 from duckdb import ColumnExpression as Col
 from duckdb import ConstantExpression as Lit
 from duckdb import DuckDBPyRelation, Expression
+from duckdb import FunctionExpression as F
+from duckdb import LambdaExpression as Lambda
 
 false = Lit("FALSE")
-none = Lit("NULL")
+none = Lit(None)
 true = Lit("TRUE")
 
 
@@ -13,8 +17,10 @@ def with_columns(
     **named_cols: Expression,
 ) -> DuckDBPyRelation:
     """Add or replace columns."""
+    if not cols and not named_cols:
+        return rel
     # column names for positional and keyword arg expressions
-    new_col_names = {expr.get_name() for expr in cols} | set(named_cols)
+    new_col_names = frozenset(expr.get_name() for expr in cols).union(named_cols)
     # new columns that are explicitly aliased
     aliased_named = [expr.alias(name) for name, expr in named_cols.items()]
     # existing columns that won't be overridden
@@ -1,13 +1,17 @@
+from datetime import date
+
 from duckdb import DuckDBPyRelation, Expression
 from duckdb.typing import DATE, VARCHAR
 
-from .common import Case, Col, F, Lambda, Lit, none, with_columns
+from .common import Case, Coalesce, Col, F, Lambda, Lit, none, with_columns
 
 
 def convert_int_expr_to_date(col: Expression) -> Expression:
     col_as_str = col.cast(VARCHAR)
-    is_valid = F("regexp_matches", col_as_str, Lit(r"^\d{8}$"))
-    parsed = F("strptime", col_as_str, Lit("%Y%m%d"))
+    # try_strptime yields NULL for unparsable values; the length check rejects
+    # non-padded values like 2024011 that %m/%d would otherwise accept.
+    is_valid = F("length", col_as_str) == Lit(8)
+    parsed = F("try_strptime", col_as_str, Lit("%Y%m%d"))
     return (Case(is_valid, parsed.cast(DATE))).alias(col.get_name())
 
 
@@ -22,7 +26,8 @@ def timestamp_to_date(
 ) -> Expression:
     """Converts timestamp expression to date with optional format and timezone normalization."""
     if timestamp_format:
-        parsed = F("strptime", col, Lit(timestamp_format))
+        # Values not matching the format become NULL instead of failing the query
+        parsed = F("try_strptime", col, Lit(timestamp_format))
         return parsed.cast(DATE).alias(col.get_name())
     else:
         return col.cast(DATE).alias(col.get_name())
@@ -34,7 +39,9 @@ def convert_timestamps_to_dates(
     timestamp_format: str | None = None,
 ) -> DuckDBPyRelation:
     """Converts timestamp columns to date columns with optional format and timezone normalization."""
-    columns_to_check = set(columns).intersection(rel.columns)
+    rel_columns = frozenset(rel.columns)
+    # keep the caller's column order so the resulting projection is deterministic
+    columns_to_check = [col for col in columns if col in rel_columns]
     if not columns_to_check:
         return rel
 
@@ -44,6 +51,15 @@ def convert_timestamps_to_dates(
     )
 
 
+def holidays_lit(dates: list[date]) -> Expression:
+    """
+    Builds a constant DATE list expression, e.g. from `get_finnish_holidays`.
+    Pass it as `days_to_ignore_col` of `datediff` so the list is folded once
+    instead of being carried as a per-row column.
+    """
+    return F("list_value", *[Lit(d) for d in dates])
+
+
 def datediff(
     start_date_col: Expression,
     end_date_col: Expression,
@@ -51,39 +67,45 @@ def datediff(
 ) -> Expression:
     """
     Calculates the number of days between the `start_date_col` and `end_date_col`.
-    Ignores the dates in the array `days_to_ignore_col`.
+    Ignores the dates in the array `days_to_ignore_col`; each ignored date is
+    counted once. Days are calendar days, as in `date_diff('day', ...)`, so
+    TIMESTAMP inputs count day boundaries crossed. A start after the end gives 0.
 
     :param start_date_col: Represents the start date of the time period.
     :param end_date_col: Represents the end date of the time period.
     :param days_to_ignore_col: Array containing the dates that should be ignored.
+        Prefer a constant list from `holidays_lit` when the dates are the same for every row.
     :return: Expression representing the number of days between the start and end dates.
     """
     if days_to_ignore_col is None:
         # date_diff('day', start, end)
         return F("date_diff", Lit("day"), start_date_col, end_date_col)
     else:
-        # Generate date range: generate_series(start, end, INTERVAL 1 DAY)
-        date_array = F("generate_series", start_date_col, end_date_col, Lit("1 day"))
-
         # Coalesce days_to_ignore with empty array
-        days_to_ignore_safe = F("coalesce", days_to_ignore_col, F("list_value"))
-
-        # array_except: list_filter to exclude ignored days
-        # DuckDB: list_filter(date_array, x -> NOT list_contains(ignore_list, x))
-        filtered_dates = F(
-            "list_filter",
-            date_array,
-            Lambda(
-                "x",
-                F(
-                    "not",
-                    F("list_contains", days_to_ignore_safe, Col("x")),
+        days_to_ignore_safe = Coalesce(days_to_ignore_col, F("list_value"))
+
+        # Days in [start, end], both ends included
+        day_count = F("date_diff", Lit("day"), start_date_col, end_date_col) + Lit(1)
+
+        # Distinct ignored days that fall inside [start, end]
+        # DuckDB: len(list_filter(list_distinct(ignore_list), x -> x BETWEEN start AND end))
+        ignored_count = F(
+            "len",
+            F(
+                "list_filter",
+                F("list_distinct", days_to_ignore_safe),
+                Lambda(
+                    "x",
+                    (Col("x") >= start_date_col) & (Col("x") <= end_date_col),
                 ),
             ),
         )
 
-        # len(filtered) - 1, minimum 0
-        date_count = F("greatest", F("len", filtered_dates) - Lit("1"), Lit("0"))
+        # day_count - ignored_count - 1, minimum 0
+        date_count = F("greatest", day_count - ignored_count - Lit(1), Lit(0))
 
-        # Handle null end_date
-        return Case(F("isnull", end_date_col), none).otherwise(date_count)
+        # Null start or end date gives NULL, as without an ignore list;
+        # greatest() alone would skip the NULL and return 0
+        return Case(start_date_col.isnull() | end_date_col.isnull(), none).otherwise(
+            date_count
+        )
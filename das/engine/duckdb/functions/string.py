@@ -1,14 +1,19 @@
 from duckdb import DuckDBPyRelation, Expression
+from duckdb.typing import VARCHAR
 
-from .common import Col, F, Lambda, Lit, with_columns
+from .common import Case, Col, F, Lambda, Lit, with_columns
 
 
 def lowercase_columns(rel: DuckDBPyRelation) -> DuckDBPyRelation:
     """Changes the column names to lowercase format."""
-    columns_to_change = [c for c in rel.columns if c != c.lower()]
-    if not columns_to_change:  # Don't make a new select in case of no transform needed
+    columns = rel.columns
+    renames = {c: c.lower() for c in columns if c != c.lower()}
+    if not renames:  # Don't make a new select in case of no transform needed
         return rel
-    return rel.select(*[Col(c).alias(c.lower()) for c in rel.columns])
+    # Only the renamed columns need an alias; the rest are passed through as-is
+    return rel.select(
+        *[Col(c).alias(renames[c]) if c in renames else Col(c) for c in columns]
+    )
 
 
 def get_string_column_names(rel: DuckDBPyRelation) -> list[str]:
@@ -16,7 +21,7 @@ def get_string_column_names(rel: DuckDBPyRelation) -> list[str]:
     return [
         name
         for name, dtype in zip(rel.columns, rel.types, strict=True)
-        if str(dtype) == "VARCHAR"
+        if dtype == VARCHAR
     ]
 
 
@@ -34,6 +39,16 @@ def nullify_string_columns(rel: DuckDBPyRelation) -> DuckDBPyRelation:
     )
 
 
+def _capitalize(part: Expression) -> Expression:
+    """Uppercase the first character and lowercase the rest, like initcap."""
+    # The || operator keeps NULL input NULL; concat() would return ''
+    return F(
+        "||",
+        F("upper", F("left", part, Lit(1))),
+        F("lower", F("substr", part, Lit(2))),
+    )
+
+
 def normalize_municipality_name(col: Expression) -> Expression:
     """
     Normalizes Finnish municipality names by capitalizing each part.
@@ -42,12 +57,18 @@ def normalize_municipality_name(col: Expression) -> Expression:
         "MÄNTTÄ-VILPPULA" → "Mänttä-Vilppula"
         "turku" → "Turku"
     """
-    return F(
+    # Only hyphenated names need the split/transform/join list round-trip
+    capitalized_parts = F(
         "array_to_string",
         F(
             "list_transform",
             F("str_split", col, Lit("-")),
-            Lambda("x", F("initcap", Col("x"))),
+            Lambda("x", _capitalize(Col("x"))),
         ),
         Lit("-"),
-    ).alias(col.get_name())
+    )
+    return (
+        Case(F("contains", col, Lit("-")), capitalized_parts)
+        .otherwise(_capitalize(col))
+        .alias(col.get_name())
+    )
@@ -1,23 +1,45 @@
 import duckdb
 
-from .functions.string import (
-    lowercase_columns,
-    nullify_string_columns,
-    trim_string_columns,
-)
+from .functions.common import Col, F, Lit
+from .functions.string import get_string_column_names
 
 
-def _read_from_parquet(dataset_path: str) -> duckdb.DuckDBPyRelation:
-    return duckdb.read_parquet(dataset_path)
+def _read_from_parquet(
+    dataset_path: str,
+    columns: list[str] | None = None,
+    where: duckdb.Expression | None = None,
+) -> duckdb.DuckDBPyRelation:
+    """Reads the dataset, pushing the optional projection and filter into the scan."""
+    rel = duckdb.read_parquet(dataset_path)
+    if where is not None:
+        rel = rel.filter(where)
+    if columns is not None:
+        rel = rel.select(*columns)
+    return rel
 
 
 def _clean(df: duckdb.DuckDBPyRelation) -> duckdb.DuckDBPyRelation:
-    """Cleans the given dataframe (lower-case columns, trim, nullify empty strings)."""
-    df = lowercase_columns(df)
-    df = trim_string_columns(df)
-    df = nullify_string_columns(df)
-    return df
+    """Cleans the given dataframe (lower-case columns, trim, nullify empty strings).
 
+    Renaming and string cleaning are emitted as a single projection so DuckDB
+    binds and optimizes one plan node instead of a chain.
+    """
+    columns = df.columns
+    string_cols = set(get_string_column_names(df))
+    if not string_cols and all(c == c.lower() for c in columns):
+        return df
+    return df.select(
+        *[
+            (F("nullif", F("trim", Col(c)), Lit("")) if c in string_cols else Col(c))
+            .alias(c.lower())
+            for c in columns
+        ]
+    )
 
-def read_from_parquet_and_clean(dataset_path: str) -> duckdb.DuckDBPyRelation:
-    return _clean(_read_from_parquet(dataset_path))
+
+def read_from_parquet_and_clean(
+    dataset_path: str,
+    columns: list[str] | None = None,
+    where: duckdb.Expression | None = None,
+) -> duckdb.DuckDBPyRelation:
+    return _clean(_read_from_parquet(dataset_path, columns, where))
@@ -58,6 +58,17 @@ def nullify_string_columns(df: pl.LazyFrame) -> pl.LazyFrame:
     )
 
 
+def clean_string_columns(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Trims whitespace and replaces empty strings with nulls in one projection."""
+    string_cols = get_string_column_names(df)
+    return df.with_columns(
+        *[
+            pl.col(col_name).str.strip_chars().replace("", None)
+            for col_name in string_cols
+        ]
+    )
+
+
 def normalize_municipality_name(col: pl.Expr) -> pl.Expr:
     """
     Normalizes Finnish municipality names by capitalizing each part.
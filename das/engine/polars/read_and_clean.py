@@ -1,23 +1,32 @@
 import polars as pl
 
-from .functions.string import (
-    lowercase_columns,
-    nullify_string_columns,
-    trim_string_columns,
-)
+from .functions.string import clean_string_columns, lowercase_columns
 
 
-def _read_from_parquet(dataset_path: str) -> pl.LazyFrame:
-    return pl.read_parquet(dataset_path).lazy()
+def _read_from_parquet(
+    dataset_path: str,
+    columns: list[str] | None = None,
+    where: pl.Expr | None = None,
+) -> pl.LazyFrame:
+    """Scans the dataset, pushing the optional projection and filter into the scan."""
+    lf = pl.scan_parquet(dataset_path)
+    if where is not None:
+        lf = lf.filter(where)
+    if columns is not None:
+        lf = lf.select(columns)
+    return lf
 
 
 def _clean(df: pl.LazyFrame) -> pl.LazyFrame:
     """Cleans the given dataframe (lower-case columns, trim, nullify empty strings)."""
     df = lowercase_columns(df)
-    df = trim_string_columns(df)
-    df = nullify_string_columns(df)
+    df = clean_string_columns(df)
     return df
 
 
-def read_from_parquet_and_clean(dataset_path: str) -> pl.LazyFrame:
-    return _clean(_read_from_parquet(dataset_path))
+def read_from_parquet_and_clean(
+    dataset_path: str,
+    columns: list[str] | None = None,
+    where: pl.Expr | None = None,
+) -> pl.LazyFrame:
+    return _clean(_read_from_parquet(dataset_path, columns, where))
@@ -1,4 +1,5 @@
 from typing import ClassVar, TypeVar, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 import wrapt
 
@@ -21,6 +22,38 @@ class ColBase[T]:
         self.name = name
 
 
+# column annotations declared directly on a class, shared by all of its subclasses;
+# weak keys so dynamically created schema classes can still be garbage collected
+_own_columns_cache: WeakKeyDictionary[type, dict[str, tuple[type[ColBase], type]]] = (
+    WeakKeyDictionary()
+)
+
+
+def _own_columns(base: type) -> dict[str, tuple[type[ColBase], type]]:
+    """Return `{attr_name: (column class, column type)}` for columns declared on `base` itself."""
+    cached = _own_columns_cache.get(base)
+    if cached is not None:
+        return cached
+
+    columns: dict[str, tuple[type[ColBase], type]] = {}
+
+    # Get annotations (use getattr to handle Python 3.14 lazy annotations)
+    own_annotations = getattr(base, "__annotations__", {})
+    if isinstance(own_annotations, dict):
+        # Extract columns from class definition
+        for attr_name, annotation in own_annotations.items():
+            attr_class = get_origin(annotation)
+            if (
+                attr_class is not None
+                and isinstance(attr_class, type)
+                and issubclass(attr_class, ColBase)
+            ):
+                columns[attr_name] = (attr_class, get_args(annotation)[0])
+
+    _own_columns_cache[base] = columns
+    return columns
+
+
 class TypedDataFrameBase(wrapt.ObjectProxy):
     """
     Base class for schema definitions for any DataFrame-like class.
@@ -45,32 +78,22 @@ class TypedDataFrameBase(wrapt.ObjectProxy):
             return
 
         # Collect column annotations from all suitable base classes
-        all_annotations = {}
+        columns: dict[str, tuple[type[ColBase], type]] = {}
 
         for base in reversed(cls.__mro__):  # from base to derived
             # skip non-relevant base classes
             if base in (object, wrapt.ObjectProxy, TypedDataFrameBase):
                 continue
+            columns.update(_own_columns(base))
 
-            # Get annotations (use getattr to handle Python 3.14 lazy annotations)
-            own_annotations = getattr(base, "__annotations__", {})
-            if not isinstance(own_annotations, dict):
-                continue
+        for attr_name, (col_class, col_type) in columns.items():
+            col = col_class(col_type)
+            col.name = attr_name
+            setattr(cls, attr_name, col)
 
-            # Extract columns from class definition
-            for attr_name, annotation in own_annotations.items():
-                attr_class = get_origin(annotation)
-                if (
-                    attr_class is not None
-                    and isinstance(attr_class, type)
-                    and issubclass(attr_class, ColBase)
-                ):
-                    args = get_args(annotation)
-                    col_type = args[0]
-                    col = attr_class(col_type)
-                    col.name = attr_name
-                    all_annotations[attr_name] = col_type
-                    setattr(cls, attr_name, col)
+        all_annotations = {
+            attr_name: col_type for attr_name, (_, col_type) in columns.items()
+        }
 
         # construct schema class
         cls._schema_class = type(
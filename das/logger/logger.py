@@ -14,9 +14,9 @@ TODO:
     - other logging use cases.
 """
 
-import inspect
 import logging
 import os
+import sys
 from enum import IntEnum
 from pathlib import Path
 
@@ -63,9 +63,10 @@ def get_log_level_from_env(default: LOG_LEVEL = LOG_LEVEL.INFO) -> LOG_LEVEL:
 
 
 def _get_caller_path(levels: int = 3) -> str:
-    stack = inspect.stack()[3]
-    function_name = stack.function
-    filepath = Path(stack.filename)
+    # frames: 0 = this function, 1 = _log, 2 = public log_* function, 3 = caller
+    frame = sys._getframe(3)
+    function_name = frame.f_code.co_name
+    filepath = Path(frame.f_code.co_filename)
     short_path = "/".join(filepath.parts[-levels:])
     return f"{short_path}:{function_name}"
 
@@ -85,10 +86,21 @@ def _setup_logger(level: LOG_LEVEL | int | None = None) -> logging.Logger:
     return logger
 
 
+# configured once at import; LOG_LEVEL is read from the environment here
+_LOGGER = _setup_logger()
+
+
+def set_log_level(level: LOG_LEVEL | int) -> None:
+    """Change the log level at runtime."""
+    _LOGGER.setLevel(level)
+
+
 def _log(level: LOG_LEVEL, message: str | None = None):
-    logger = _setup_logger()
+    if not _LOGGER.isEnabledFor(level):
+        return
     msg = f" - {message}" if message else ""
-    logger.log(level, f"{_get_caller_path()}{msg}")
+    # let logging do the final formatting only when a record is actually emitted
+    _LOGGER.log(level, "%s%s", _get_caller_path(), msg)
 
 
 # Public logging API.
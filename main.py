@@ -8,37 +8,39 @@ from pathlib import Path
 import duckdb
 import polars as pl
 
-from src.db.duckdb_io import connect_db, write_lazyframe
+from src.db.duckdb_io import connect_db, write_dataframe
 from src.etl.pipeline import run_bronze, run_gold, run_silver
 from src.constants import Schema
+from src.gold import create_observations_per_patient_table
 from src.reporting.etl_reporting import (
     print_bronze_summary,
     print_gold_summary,
     print_silver_summary,
 )
 
-DEFAULT_INPUT_DIR = Path(__file__).resolve().parent / "data" / "EPS"
-DEFAULT_DB_PATH = Path(__file__).resolve().parent / "fhir.duckdb"
+_HERE = Path(__file__).resolve().parent
+DEFAULT_INPUT_DIR = _HERE / "data" / "EPS"
+DEFAULT_DB_PATH = _HERE / "fhir.duckdb"
 
 
 def save_silver_tables(
     con: duckdb.DuckDBPyConnection,
-    patient_lf: pl.LazyFrame,
-    condition_lf: pl.LazyFrame,
-    observation_lf: pl.LazyFrame,
+    patient_df: pl.DataFrame,
+    condition_df: pl.DataFrame,
+    observation_df: pl.DataFrame,
 ) -> None:
-    """Save silver LazyFrames to DuckDB for debugging purposes."""
-    write_lazyframe(con, Schema.SILVER, "patient", patient_lf)
-    write_lazyframe(con, Schema.SILVER, "condition", condition_lf)
-    write_lazyframe(con, Schema.SILVER, "observation", observation_lf)
+    """Save collected silver DataFrames to DuckDB for debugging purposes."""
+    write_dataframe(con, Schema.SILVER, "patient", patient_df)
+    write_dataframe(con, Schema.SILVER, "condition", condition_df)
+    write_dataframe(con, Schema.SILVER, "observation", observation_df)
 
 
-def save_gold_tables(con: duckdb.DuckDBPyConnection, gold_lf: pl.LazyFrame) -> None:
-    """Save gold tables to DuckDB."""
-    write_lazyframe(con, Schema.GOLD, "observations_per_patient", gold_lf)
+def save_gold_tables(con: duckdb.DuckDBPyConnection, gold_df: pl.DataFrame) -> int:
+    """Save gold tables to DuckDB and return the number of rows written."""
+    return write_dataframe(con, Schema.GOLD, "observations_per_patient", gold_df)
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Load FHIR Bundle JSON files into DuckDB tables for analysis."
     )
@@ -60,7 +62,19 @@ def main() -> None:
         action="store_true",
         help="Write intermediate silver tables to DB for debugging",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--duckdb-json",
+        action="store_true",
+        help="Parse bundles with DuckDB's JSON reader instead of Python",
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main() -> None:
+    args = _PARSER.parse_args()
 
     if not args.input.exists():
         raise SystemExit(f"Input directory does not exist: {args.input}")
@@ -68,7 +82,7 @@ def main() -> None:
     con = connect_db(args.db)
 
     # Load bundles to bronze layer
-    summary = run_bronze(args.input, con)
+    summary = run_bronze(args.input, con, duckdb_json=args.duckdb_json)
     print_bronze_summary(summary)
 
     # Transform bronze → sources → models (in-memory only by default)
@@ -76,24 +90,33 @@ def main() -> None:
     print("Transforming to silver layer...")
     patient_lf, condition_lf, observation_lf = run_silver(con)
 
-    # Optionally save silver tables for debugging
+    patient_df, condition_df, observation_df = pl.collect_all(
+        [patient_lf, condition_lf, observation_lf]
+    )
     if args.debug:
         print("  (debug mode: writing silver tables to DB)")
         save_silver_tables(
             con,
-            patient_lf,
-            condition_lf,
-            observation_lf,
+            patient_df,
+            condition_df,
+            observation_df,
         )
 
-    print_silver_summary(patient_lf, condition_lf, observation_lf)
+    print_silver_summary(patient_df.lazy(), condition_df.lazy(), observation_df.lazy())
 
-    # Build gold layer from silver LazyFrames
     print()
     print("Building gold layer...")
-    gold_observations_lf = run_gold(patient_lf, observation_lf)
-    save_gold_tables(con, gold_observations_lf)
-    print_gold_summary(gold_observations_lf)
+    if args.debug:
+        # Silver tables are persisted, so gold is built from them inside DuckDB
+        gold_rows = create_observations_per_patient_table(con)
+    else:
+        # Gold reads the collected silver frames, so silver plans run only once;
+        # the streaming engine runs the join and aggregation in batches
+        gold_observations_df = run_gold(
+            patient_df.lazy(), observation_df.lazy()
+        ).collect(engine="streaming")
+        gold_rows = save_gold_tables(con, gold_observations_df)
+    print_gold_summary(gold_rows)
 
     con.close()
 
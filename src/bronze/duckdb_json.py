@@ -0,0 +1,98 @@
+"""Load FHIR Bundle JSON files into bronze tables with DuckDB's JSON reader.
+
+Alternative to `src.bronze.loader` that keeps parsing inside DuckDB: bundle
+entries are read with `read_json`, each resource type's structure is inferred
+with `json_group_structure`, and resources are expanded into columns with
+`json_transform`. No resource passes through Python objects.
+"""
+
+from pathlib import Path
+
+import duckdb
+
+from src.common.sql import qualified_table, quote_literal
+from src.constants import Schema
+from src.db.duckdb_io import ensure_schema
+
+# Bundles are single JSON documents; allow large ones (default limit is 16 MB)
+_MAX_BUNDLE_BYTES = 1024 * 1024 * 1024
+
+_ENTRIES_TABLE = "_bronze_bundle_entries"
+
+
+def load_bronze_tables_with_duckdb(
+    bundle_dir: Path,
+    con: duckdb.DuckDBPyConnection,
+) -> dict[str, int]:
+    """Load all bundle JSON files in a directory into bronze tables.
+
+    Creates one table per resource type with the same metadata fields as
+    `load_bronze_bundles` (_source_file, _source_bundle, _full_url) and
+    returns row counts keyed by table name.
+    """
+    # read_json fails on a glob without matches; an empty directory loads nothing
+    if next(bundle_dir.glob("*.json"), None) is None:
+        return {}
+    bundle_glob = quote_literal(str(bundle_dir / "*.json"))
+    # One transaction for all tables, as in `write_dataframes`: a failure
+    # leaves the previous bronze tables in place
+    con.begin()
+    try:
+        ensure_schema(con, Schema.BRONZE)
+        con.execute(
+            f"""
+            CREATE OR REPLACE TEMP TABLE {_ENTRIES_TABLE} AS
+            SELECT
+                _source_file,
+                _source_bundle,
+                entry ->> 'fullUrl' AS _full_url,
+                entry -> 'resource' AS resource,
+                entry -> 'resource' ->> 'resourceType' AS resource_type
+            FROM (
+                SELECT
+                    parse_filename(filename) AS _source_file,
+                    id AS _source_bundle,
+                    unnest(entry) AS entry
+                FROM read_json(
+                    {bundle_glob},
+                    columns = {{id: 'VARCHAR', entry: 'JSON[]'}},
+                    filename = true,
+                    maximum_object_size = {_MAX_BUNDLE_BYTES}
+                )
+            )
+            """
+        )
+        structures = con.execute(
+            f"""
+            SELECT resource_type, json_group_structure(resource), COUNT(*)
+            FROM {_ENTRIES_TABLE}
+            WHERE resource_type IS NOT NULL
+            GROUP BY resource_type
+            ORDER BY resource_type
+            """
+        ).fetchall()
+
+        summary: dict[str, int] = {}
+        for resource_type, structure, row_count in structures:
+            table = resource_type.lower()
+            con.execute(
+                f"""
+                CREATE OR REPLACE TABLE {qualified_table(Schema.BRONZE, table)} AS
+                SELECT
+                    unnest(json_transform(resource, {quote_literal(structure)})),
+                    _source_file,
+                    _source_bundle,
+                    _full_url
+                FROM {_ENTRIES_TABLE}
+                WHERE resource_type = ?
+                """,
+                [resource_type],
+            )
+            summary[table] = row_count
+        con.execute(f"DROP TABLE {_ENTRIES_TABLE}")
+    except BaseException:
+        con.rollback()
+        raise
+    con.commit()
+
+    return summary
@@ -5,6 +5,7 @@ such as Reference, CodeableConcept, Identifier, and other FHIR data types.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
@@ -12,11 +13,15 @@ def iter_dict_list(value: Any) -> list[dict[str, Any]]:
     """Safely iterate over a list that should contain dicts.
 
     Returns only dict items from the list, filtering out any non-dict values.
-    Returns empty list if value is not a list.
+    Returns empty list if value is not a list. The input list itself is
+    returned when every item is already a dict, so callers must not mutate it.
     """
     if not isinstance(value, list):
         return []
-    return [v for v in value if isinstance(v, dict)]
+    for v in value:
+        if not isinstance(v, dict):
+            return [v for v in value if isinstance(v, dict)]
+    return value
 
 
 def iter_codings(codeable_concept: Any) -> list[dict[str, Any]]:
@@ -26,7 +31,7 @@ def iter_codings(codeable_concept: Any) -> list[dict[str, Any]]:
     return iter_dict_list(codeable_concept.get("coding"))
 
 
-@dataclass
+@dataclass(slots=True)
 class Coding:
     """Represents a FHIR Coding with system, code, and display."""
 
@@ -89,6 +94,7 @@ def extract_reference(ref_obj: Any) -> str | None:
     return str(ref) if ref else None
 
 
+@lru_cache(maxsize=65536)
 def extract_reference_id(reference: str | None) -> str | None:
     """Extract the ID portion from a FHIR reference string.
 
@@ -96,14 +102,15 @@ def extract_reference_id(reference: str | None) -> str | None:
     - "Patient/123" -> "123"
     - "urn:uuid:abc-def" -> "abc-def"
     - "123" -> "123"
+
+    Results are cached: the same subject and performer references recur
+    across many resources.
     """
     if not reference:
         return None
     if reference.startswith("urn:uuid:"):
-        return reference.split("urn:uuid:", 1)[1] or None
-    if "/" in reference:
-        return reference.rsplit("/", 1)[-1] or None
-    return reference
+        return reference[len("urn:uuid:") :] or None
+    return reference.rpartition("/")[2] or None
 
 
 def _find_in_list_by_field(
@@ -118,6 +125,23 @@ def _find_in_list_by_field(
     return None
 
 
+def index_by_field(
+    items: list[dict] | None, match_field: str, return_field: str
+) -> dict[Any, Any]:
+    """Map each match_field value to return_field of the first item carrying it.
+
+    Build the index once when several values are looked up in the same list;
+    `index.get(value)` then matches `_find_in_list_by_field(items, ...)`.
+    """
+    index: dict[Any, Any] = {}
+    if not items:
+        return index
+    for item in items:
+        if isinstance(item, dict):
+            index.setdefault(item.get(match_field), item.get(return_field))
+    return index
+
+
 def extract_identifier(identifier_list: list[dict] | None, system: str) -> str | None:
     """Extract identifier value by system from FHIR identifier array."""
     return _find_in_list_by_field(identifier_list, "system", system, "value")
@@ -139,7 +163,7 @@ def _extract_field_from_list(
             value = item.get(field)
             if value is not None:
                 if isinstance(value, list):
-                    return list_separator.join(str(v) for v in value)
+                    return list_separator.join(map(str, value))
                 return str(value) if value else None
     return None
 
@@ -1,9 +1,17 @@
-"""Small SQL identifier helpers shared across layers."""
+"""Small SQL identifier and literal helpers shared across layers."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=512)
 def quote_ident(ident: str) -> str:
-    return f'"{ident.replace(chr(34), chr(34) * 2)}"'
+    return '"' + ident.replace('"', '""') + '"'
 
 
+@lru_cache(maxsize=512)
 def qualified_table(schema: str, table: str) -> str:
     return f"{quote_ident(schema)}.{quote_ident(table)}"
+
+
+def quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
@@ -5,6 +5,7 @@ from .duckdb_io import (
     drop_table_if_exists,
     ensure_schema,
     get_table_summary,
+    list_tables,
     write_dataframe,
     write_dataframes,
     write_lazyframe,
@@ -15,6 +16,7 @@ __all__ = [
     "drop_table_if_exists",
     "ensure_schema",
     "get_table_summary",
+    "list_tables",
     "write_dataframe",
     "write_dataframes",
     "write_lazyframe",
@@ -1,16 +1,34 @@
 """DuckDB IO helpers for schema and table operations."""
 
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from uuid import uuid4
 
 import duckdb
 import polars as pl
 
-from src.common.sql import qualified_table, quote_ident
+from src.common.sql import qualified_table, quote_ident, quote_literal
+from src.constants import Schema
+
+_ETL_CONFIG = {
+    "preserve_insertion_order": "false",
+    "checkpoint_threshold": "1GB",
+}
 
 
 def connect_db(path: Path) -> duckdb.DuckDBPyConnection:
-    """Connect to DuckDB database file."""
-    return duckdb.connect(str(path))
+    """Connect to DuckDB database file and prepare it for bulk ETL writes.
+
+    Insertion order is not preserved: tables are rebuilt with
+    `CREATE OR REPLACE TABLE ... AS SELECT`, so readers that need a stable
+    row order must sort (the silver build reads bronze ordered by id).
+    A high checkpoint threshold lets a whole layer be written before the WAL
+    is checkpointed. All medallion schemas are created once here.
+    """
+    con = duckdb.connect(str(path), config=_ETL_CONFIG)
+    for schema in Schema:
+        ensure_schema(con, schema)
+    return con
 
 
 def ensure_schema(con: duckdb.DuckDBPyConnection, schema: str) -> None:
@@ -24,26 +42,58 @@ def write_lazyframe(
     table: str,
     lf: pl.LazyFrame,
 ) -> None:
-    """Write LazyFrame to DuckDB table in given schema."""
-    df = lf.collect()
-    write_dataframe(con, schema, table, df)
+    """Write LazyFrame to DuckDB table in given schema.
 
+    The LazyFrame is streamed to a temporary Parquet file with `sink_parquet`
+    and loaded with DuckDB's Parquet reader, so the full result is never
+    materialized in Python memory.
+    """
+    ensure_schema(con, schema)
+    with TemporaryDirectory() as tmp_dir:
+        parquet_path = Path(tmp_dir) / "data.parquet"
+        # The file is read back once and deleted; favour fast codecs over size
+        lf.sink_parquet(parquet_path, compression="lz4")
+        con.execute(
+            f"CREATE OR REPLACE TABLE {qualified_table(schema, table)} "
+            f"AS SELECT * FROM read_parquet({quote_literal(str(parquet_path))})"
+        )
 
-def write_dataframe(
+
+def _create_table_from_dataframe(
     con: duckdb.DuckDBPyConnection,
     schema: str,
     table: str,
     df: pl.DataFrame,
 ) -> None:
-    """Write DataFrame to DuckDB table in given schema."""
+    # Register the frame under a unique name: a replacement scan of a local
+    # variable would silently read a catalog table or view of the same name.
+    # DuckDB reads the registered Polars frame through its Arrow stream.
+    view_name = f"_write_{uuid4().hex}"
+    con.register(view_name, df)
+    try:
+        con.execute(
+            f"CREATE OR REPLACE TABLE {qualified_table(schema, table)} "
+            f"AS SELECT * FROM {quote_ident(view_name)}"
+        )
+    finally:
+        con.unregister(view_name)
+
+
+def write_dataframe(
+    con: duckdb.DuckDBPyConnection,
+    schema: str,
+    table: str,
+    df: pl.DataFrame,
+) -> int:
+    """Write DataFrame to DuckDB table in given schema and return its row count.
+
+    The frame is already materialized, so unlike `write_lazyframe` it is not
+    staged through Parquet: it is registered with DuckDB, which reads it
+    through its Arrow stream interface with no encode/decode round trip.
+    """
     ensure_schema(con, schema)
-    temp_name = f"{schema}_{table}_temp"
-    con.register(temp_name, df.to_arrow())
-    con.execute(
-        f"CREATE OR REPLACE TABLE {qualified_table(schema, table)} "
-        f"AS SELECT * FROM {temp_name}"
-    )
-    con.unregister(temp_name)
+    _create_table_from_dataframe(con, schema, table, df)
+    return df.height
 
 
 def write_dataframes(
@@ -51,9 +101,20 @@ def write_dataframes(
     schema: str,
     frames: dict[str, pl.DataFrame],
 ) -> None:
-    """Write multiple DataFrames to DuckDB tables in given schema."""
-    for table, df in frames.items():
-        write_dataframe(con, schema, table, df)
+    """Write multiple DataFrames to DuckDB tables in given schema.
+
+    All tables are written in one transaction, so the catalog changes are
+    committed once and a failure leaves the previous tables in place.
+    """
+    con.begin()
+    try:
+        ensure_schema(con, schema)
+        for table, df in frames.items():
+            _create_table_from_dataframe(con, schema, table, df)
+    except BaseException:
+        con.rollback()
+        raise
+    con.commit()
 
 
 def drop_table_if_exists(con: duckdb.DuckDBPyConnection, schema: str, table: str) -> None:
@@ -61,9 +122,9 @@ def drop_table_if_exists(con: duckdb.DuckDBPyConnection, schema: str, table: str
     con.execute(f"DROP TABLE IF EXISTS {qualified_table(schema, table)}")
 
 
-def get_table_summary(con: duckdb.DuckDBPyConnection, schema: str) -> dict[str, int]:
-    """Get row counts for all tables in a schema."""
-    table_names = con.execute(
+def list_tables(con: duckdb.DuckDBPyConnection, schema: str) -> list[str]:
+    """List base table names in a schema, sorted by name."""
+    rows = con.execute(
         """
         SELECT table_name
         FROM information_schema.tables
@@ -73,10 +134,41 @@ def get_table_summary(con: duckdb.DuckDBPyConnection, schema: str) -> dict[str,
         """,
         [schema],
     ).fetchall()
-    summary: dict[str, int] = {}
-    for (table_name,) in table_names:
-        count = con.execute(
-            f"SELECT COUNT(*) FROM {qualified_table(schema, table_name)}"
-        ).fetchone()[0]
-        summary[f"{schema}.{table_name}"] = count
-    return summary
+    return [table_name for (table_name,) in rows]
+
+
+def get_table_summary(
+    con: duckdb.DuckDBPyConnection, schema: str, *, exact: bool = False
+) -> dict[str, int]:
+    """Get row counts for all tables in a schema.
+
+    By default counts are estimates from DuckDB's table metadata
+    (`duckdb_tables().estimated_size`). They avoid scanning any table and
+    match freshly written CREATE TABLE ... AS tables, but can be off after
+    DELETE or UPDATE. Pass `exact=True` to count rows with `COUNT(*)`.
+    """
+    if not exact:
+        rows = con.execute(
+            """
+            SELECT table_name, estimated_size
+            FROM duckdb_tables()
+            WHERE database_name = current_database()
+              AND schema_name = ?
+              AND NOT temporary
+            ORDER BY table_name
+            """,
+            [schema],
+        ).fetchall()
+        return {f"{schema}.{table_name}": row_count for table_name, row_count in rows}
+
+    table_names = list_tables(con, schema)
+    if not table_names:
+        return {}
+    # Count all tables in one query instead of one round-trip per table
+    counts_sql = " UNION ALL ".join(
+        f"SELECT ? AS table_name, COUNT(*) AS row_count "
+        f"FROM {qualified_table(schema, table_name)}"
+        for table_name in table_names
+    )
+    counts = dict(con.execute(counts_sql, table_names).fetchall())
+    return {f"{schema}.{table_name}": counts[table_name] for table_name in table_names}
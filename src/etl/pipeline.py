@@ -1,5 +1,6 @@
 """ETL orchestration for bronze, silver, and gold layers."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -8,58 +9,113 @@ import polars as pl
 
 from src.bronze import load_bronze_bundles
 from src.common.models import Condition, Observation, Patient
+from src.common.sql import qualified_table, quote_ident
 from src.constants import Schema
-from src.db.duckdb_io import drop_table_if_exists, get_table_summary, write_dataframes
+from src.db.duckdb_io import drop_table_if_exists, list_tables, write_dataframes
 from src.gold import build_observations_per_patient
 from src.silver.models.conditions import get_condition as get_condition_model
 from src.silver.models.observations import get_observation as get_observation_model
 from src.silver.models.patients import get_patient as get_patient_model
+from src.silver.sources import conditions, observations, patients
 from src.silver.sources.conditions import get_condition as get_condition_source
 from src.silver.sources.observations import get_observation as get_observation_source
 from src.silver.sources.patients import get_patient as get_patient_source
 
 
-def run_bronze(bundle_dir: Path, con: duckdb.DuckDBPyConnection) -> dict[str, int]:
-    """Load bronze tables and return a summary."""
-    frames = load_bronze_bundles(bundle_dir)
-    write_dataframes(con, Schema.BRONZE, frames)
-    for table in frames:
+def run_bronze(
+    bundle_dir: Path,
+    con: duckdb.DuckDBPyConnection,
+    *,
+    duckdb_json: bool = False,
+) -> dict[str, int]:
+    """Load bronze tables and return a summary.
+
+    With `duckdb_json`, bundles are parsed by DuckDB's JSON reader instead of
+    being loaded into Polars frames first.
+    """
+    if duckdb_json:
+        # Imported here so importing the bronze package does not load duckdb
+        from src.bronze.duckdb_json import load_bronze_tables_with_duckdb
+
+        row_counts = load_bronze_tables_with_duckdb(bundle_dir, con)
+    else:
+        frames = load_bronze_bundles(bundle_dir)
+        write_dataframes(con, Schema.BRONZE, frames)
+        # Row counts are known from the frames just written; no need to re-scan
+        row_counts = {table: df.height for table, df in frames.items()}
+    # Drop tables left in `main` by the pre-medallion layout; only look them up once
+    for table in row_counts.keys() & set(list_tables(con, "main")):
         drop_table_if_exists(con, "main", table)
-    return get_table_summary(con, Schema.BRONZE)
+    return {
+        f"{Schema.BRONZE}.{table}": row_counts[table] for table in sorted(row_counts)
+    }
 
 
 def _build_silver_frame(
     con: duckdb.DuckDBPyConnection,
     table: str,
+    columns: tuple[str, ...],
     source_fn: Callable[[pl.DataFrame], pl.LazyFrame],
     model_fn: Callable[[pl.LazyFrame], pl.LazyFrame],
 ) -> pl.LazyFrame:
-    bronze_df = con.execute(f"SELECT * FROM {Schema.BRONZE}.{table}").pl()
+    # A connection must not be shared across threads; each build uses its own cursor
+    with con.cursor() as cursor:
+        # Project in DuckDB so unused FHIR fields never reach Python. Optional
+        # fields absent from every bundle have no bronze column; skip those.
+        available = {
+            row[0]
+            for row in cursor.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = ? AND table_name = ?",
+                [Schema.BRONZE, table],
+            ).fetchall()
+        }
+        select_list = ", ".join(quote_ident(c) for c in columns if c in available)
+        # Bronze tables do not preserve insertion order; sort so silver rows come
+        # out in the same order on every run
+        order_by = ", ".join(
+            quote_ident(c) for c in ("id", "_source_file") if c in available
+        )
+        bronze_df = cursor.execute(
+            f"SELECT {select_list} FROM {qualified_table(Schema.BRONZE, table)}"
+            + (f" ORDER BY {order_by}" if order_by else "")
+        ).pl()
     return model_fn(source_fn(bronze_df))
 
 
 def run_silver(
     con: duckdb.DuckDBPyConnection,
 ) -> tuple[Patient, Condition, Observation]:
-    """Build silver layer LazyFrames."""
-    patient_lf = _build_silver_frame(
-        con,
-        "patient",
-        get_patient_source,
-        get_patient_model,
-    )
-    condition_lf = _build_silver_frame(
-        con,
-        "condition",
-        get_condition_source,
-        get_condition_model,
-    )
-    observation_lf = _build_silver_frame(
-        con,
-        "observation",
-        get_observation_source,
-        get_observation_model,
+    """Build silver layer LazyFrames.
+
+    The resource types are independent, so their bronze reads and source
+    transforms run concurrently.
+    """
+    builds = (
+        (
+            "patient",
+            patients.BRONZE_COLUMNS,
+            get_patient_source,
+            get_patient_model,
+        ),
+        (
+            "condition",
+            conditions.BRONZE_COLUMNS,
+            get_condition_source,
+            get_condition_model,
+        ),
+        (
+            "observation",
+            observations.BRONZE_COLUMNS,
+            get_observation_source,
+            get_observation_model,
+        ),
     )
+    with ThreadPoolExecutor(max_workers=len(builds)) as executor:
+        futures = [
+            executor.submit(_build_silver_frame, con, *build) for build in builds
+        ]
+    patient_lf, condition_lf, observation_lf = (f.result() for f in futures)
     return patient_lf, condition_lf, observation_lf
 
 
@@ -1,7 +1,11 @@
 """Gold layer - aggregations built from silver LazyFrames."""
 
-from src.gold.observations_per_patient import build_observations_per_patient
+from src.gold.observations_per_patient import (
+    build_observations_per_patient,
+    create_observations_per_patient_table,
+)
 
 __all__ = [
     "build_observations_per_patient",
+    "create_observations_per_patient_table",
 ]
@@ -1,12 +1,22 @@
-"""Gold layer aggregation: observations per patient using pure Polars."""
+"""Gold layer aggregation: observations per patient.
+
+The aggregation is built from silver LazyFrames with Polars. When the silver
+tables are already persisted in DuckDB, the same table can be created with a
+single SQL statement instead.
+"""
 
 from __future__ import annotations
 
 from datetime import date
 
+import duckdb
 import polars as pl
 
 from src.common.models import Observation, Patient
+from src.common.sql import qualified_table
+from src.constants import Schema
+
+OBSERVATIONS_PER_PATIENT_TABLE = "observations_per_patient"
 
 
 def build_observations_per_patient(
@@ -19,56 +29,114 @@ def build_observations_per_patient(
     Build observations per patient aggregation from silver LazyFrames.
 
     Aggregates observation counts per patient (identified by `subject_id`)
-    and computes patient age (in years) from `birth_date` as of `as_of`
-    (defaults to today's date).
+    and computes patient age in completed years from `birth_date` as of
+    `as_of` (defaults to today's date).
 
     Returns a LazyFrame with columns:
     - patient_id: str
     - observation_count: int
     - birth_date: date (nullable)
     - patient_age_years: int (nullable)
+
+    The plan is a join and group_by over pre-projected inputs and runs on
+    the streaming engine: collect with `.collect(engine="streaming")`.
     """
     as_of_date = as_of or date.today()
 
-    # Join patients with observations (left join to keep patients with no observations)
-    joined = patient_lf.join(
-        observation_lf.select(
-            Observation.id.alias("observation_id"), Observation.subject_id
+    # Parse birth_date on the patient side; the parse cache handles repeated
+    # dates once. One row per patient, as the previous group_by produced.
+    patients = patient_lf.select(
+        Patient.id,
+        Patient.birth_date.str.strptime(
+            pl.Date, format="%Y-%m-%d", strict=False, exact=True, cache=True
         ),
-        left_on=Patient.id,
-        right_on=Observation.subject_id,
-        how="left",
+    ).unique()
+
+    # Age in completed years: year difference, minus one if the birthday has
+    # not yet come around by as_of. Integer arithmetic only; nulls propagate.
+    # Computed per patient, before the join, so the join carries final columns.
+    birth_date = pl.col("birth_date")
+    birthday_pending = (
+        birth_date.dt.month().cast(pl.Int32) * 100 + birth_date.dt.day()
+    ) > (as_of_date.month * 100 + as_of_date.day)
+    patients = patients.with_columns(
+        (
+            (as_of_date.year - birth_date.dt.year()) - birthday_pending.cast(pl.Int32)
+        )
+        .cast(pl.Int32)
+        .alias("patient_age_years")
     )
 
-    # Group by patient and count observations
-    aggregated = joined.group_by(Patient.id, Patient.birth_date).agg(
-        pl.col("observation_id").drop_nulls().count().alias("observation_count")
+    # Count observations per subject before joining, so the join sees one row
+    # per subject instead of one per observation. pl.len() counts rows like the
+    # SQL COUNT(*) and only needs subject_id from the observation scan.
+    observation_counts = observation_lf.group_by(Observation.subject_id).agg(
+        pl.len().alias("observation_count")
     )
 
-    # Parse birth_date and calculate age
+    # Left join keeps patients with no observations
     result = (
-        aggregated.with_columns(
-            pl.col("birth_date")
-            .str.to_date(format="%Y-%m-%d", strict=False)
-            .alias("birth_date_parsed")
-        )
-        .with_columns(
-            pl.when(pl.col("birth_date_parsed").is_not_null())
-            .then(
-                (pl.lit(as_of_date) - pl.col("birth_date_parsed"))
-                .dt.total_days()
-                .floordiv(365)
-                .cast(pl.Int64)
-            )
-            .otherwise(None)
-            .alias("patient_age_years")
+        patients.join(
+            observation_counts,
+            left_on=Patient.id,
+            right_on=Observation.subject_id,
+            how="left",
         )
+        .with_columns(pl.col("observation_count").fill_null(0))
         .select(
             pl.col("id").alias("patient_id"),
             pl.col("observation_count"),
-            pl.col("birth_date_parsed").alias("birth_date"),
+            pl.col("birth_date"),
             pl.col("patient_age_years"),
         )
     )
 
     return result
+
+
+def create_observations_per_patient_table(
+    con: duckdb.DuckDBPyConnection,
+    *,
+    as_of: date | None = None,
+) -> int:
+    """
+    Create the observations per patient table from silver tables in DuckDB.
+
+    SQL equivalent of `build_observations_per_patient` that reads
+    `silver.patient` and `silver.observation` and writes
+    `gold.observations_per_patient` without leaving DuckDB.
+
+    Returns the number of rows written.
+    """
+    as_of_date = as_of or date.today()
+    target = qualified_table(Schema.GOLD, OBSERVATIONS_PER_PATIENT_TABLE)
+    # CREATE TABLE ... AS returns the number of rows written
+    (row_count,) = con.execute(
+        f"""
+        CREATE OR REPLACE TABLE {target} AS
+        WITH patients AS (
+            SELECT DISTINCT
+                id,
+                try_strptime(birth_date, '%Y-%m-%d')::DATE AS birth_date
+            FROM {qualified_table(Schema.SILVER, "patient")}
+        ),
+        observation_counts AS (
+            SELECT subject_id, COUNT(*) AS observation_count
+            FROM {qualified_table(Schema.SILVER, "observation")}
+            GROUP BY subject_id
+        )
+        SELECT
+            p.id AS patient_id,
+            -- UINTEGER matches the UInt32 count of the Polars build
+            coalesce(o.observation_count, 0)::UINTEGER AS observation_count,
+            p.birth_date,
+            (
+                ? - year(p.birth_date)
+                - (month(p.birth_date) * 100 + day(p.birth_date) > ?)::INTEGER
+            )::INTEGER AS patient_age_years
+        FROM patients AS p
+        LEFT JOIN observation_counts AS o ON o.subject_id = p.id
+        """,
+        [as_of_date.year, as_of_date.month * 100 + as_of_date.day],
+    ).fetchone()
+    return row_count
@@ -68,30 +68,32 @@ def _(mo, repo_root):
 
 
 @app.cell
-def _(db_path, duckdb):
-    con = duckdb.connect(db_path.value, read_only=True)
+def _(db_path, duckdb, mo):
+    # One read-only connection per database path for the whole session: cell
+    # reruns reuse it, so DuckDB's catalog and buffer pool stay warm
+    @mo.cache
+    def _connect(path: str) -> duckdb.DuckDBPyConnection:
+        return duckdb.connect(path, read_only=True)
+
+    con = _connect(db_path.value)
     return (con,)
 
 
 @app.cell
-def _(duckdb):
-    def get_table_names(con: duckdb.DuckDBPyConnection, schema: str) -> list[str]:
-        return [
-            row[0]
-            for row in con.sql(
-                """
-                SELECT table_name
-                FROM duckdb_tables()
-                WHERE schema_name = ?
-                  AND internal = FALSE
-                  AND temporary = FALSE
-                ORDER BY table_name
-                """,
-                params=[schema],
-            ).fetchall()
-        ]
-
-    return (get_table_names,)
+def _(con):
+    # Read the catalog once per connection; the layer cells look names up here
+    table_names_by_schema: dict[str, list[str]] = {}
+    for _schema_name, _table_name in con.sql(
+        """
+        SELECT schema_name, table_name
+        FROM duckdb_tables()
+        WHERE internal = FALSE
+          AND temporary = FALSE
+        ORDER BY schema_name, table_name
+        """
+    ).fetchall():
+        table_names_by_schema.setdefault(_schema_name, []).append(_table_name)
+    return (table_names_by_schema,)
 
 
 @app.cell
@@ -104,7 +106,7 @@ def _(mo):
 
 @app.cell
 def _(Schema, con, get_table_summary, pd):
-    summary = get_table_summary(con, Schema.BRONZE)
+    summary = get_table_summary(con, Schema.BRONZE, exact=True)
     summary_df = (
         pd.DataFrame([{"table": name, "rows": rows} for name, rows in summary.items()])
         .sort_values(["rows", "table"], ascending=[False, True])
@@ -115,8 +117,8 @@ def _(Schema, con, get_table_summary, pd):
 
 
 @app.cell
-def _(Schema, con, get_table_names, mo):
-    bronze_table_names = get_table_names(con, Schema.BRONZE)
+def _(Schema, mo, table_names_by_schema):
+    bronze_table_names = table_names_by_schema.get(Schema.BRONZE, [])
     table = mo.ui.dropdown(
         options=bronze_table_names,
         value=bronze_table_names[0] if bronze_table_names else None,
@@ -128,14 +130,14 @@ def _(Schema, con, get_table_names, mo):
 
 @app.cell
 def _(Schema, con, mo, table):
-    sample_df = con.sql(f'SELECT * FROM {Schema.BRONZE}."{table.value}" LIMIT 10').df()
+    sample_df = con.sql(f'SELECT * FROM {Schema.BRONZE}."{table.value}" LIMIT 10').pl()
     mo.ui.table(sample_df, selection=None)
     return
 
 
 @app.cell
-def _(Schema, con, get_table_names, mo):
-    silver_table_names = get_table_names(con, Schema.SILVER)
+def _(Schema, mo, table_names_by_schema):
+    silver_table_names = table_names_by_schema.get(Schema.SILVER, [])
     _has_silver = len(silver_table_names) > 0
 
     mo.md(f"""
@@ -163,7 +165,7 @@ def _(Schema, con, mo, silver_table, silver_table_names):
     mo.stop(len(silver_table_names) == 0)
     silver_sample_df = con.sql(
         f'SELECT * FROM {Schema.SILVER}."{silver_table.value}" LIMIT 10'
-    ).df()
+    ).pl()
     mo.ui.table(silver_sample_df, selection=None)
     return
 
@@ -177,8 +179,8 @@ def _(mo):
 
 
 @app.cell
-def _(Schema, con, get_table_names, mo):
-    gold_table_names = get_table_names(con, Schema.GOLD)
+def _(Schema, mo, table_names_by_schema):
+    gold_table_names = table_names_by_schema.get(Schema.GOLD, [])
     gold_table = mo.ui.dropdown(
         options=gold_table_names,
         value=gold_table_names[0] if gold_table_names else None,
@@ -192,7 +194,7 @@ def _(Schema, con, get_table_names, mo):
 def _(Schema, con, gold_table, mo):
     gold_sample_df = con.sql(
         f'SELECT * FROM {Schema.GOLD}."{gold_table.value}" LIMIT 10'
-    ).df()
+    ).pl()
     mo.ui.table(gold_sample_df, selection=None)
     return
 
@@ -211,34 +213,94 @@ def _(mo):
 def _(Schema, con, mo):
     import plotly.graph_objects as go
 
+    # One bar per patient is unreadable past a few hundred bars: rank and cut
+    # in DuckDB. The remaining patients are summarized in an annotation; their
+    # summed count as a bar would dwarf the per-patient bars beside it.
+    chart_top_n = 200
+    _ranked = f"""
+        WITH ranked AS (
+            SELECT
+                patient_id,
+                observation_count,
+                row_number() OVER (
+                    ORDER BY observation_count DESC, patient_id
+                ) AS rank
+            FROM {Schema.GOLD}.observations_per_patient
+        )
+    """
     df = con.sql(
-        f"""
+        _ranked
+        + """
         SELECT patient_id, observation_count
-        FROM {Schema.GOLD}.observations_per_patient
-        ORDER BY observation_count DESC
-        """
-    ).df()
-
-    fig = go.Figure(data=[go.Bar(y=df["observation_count"])])
+        FROM ranked
+        WHERE rank <= ?
+        ORDER BY rank
+        """,
+        params=[chart_top_n],
+    ).pl()
+    other_patients, other_observations = con.sql(
+        _ranked
+        + """
+        SELECT count(*), coalesce(sum(observation_count), 0)
+        FROM ranked
+        WHERE rank > ?
+        """,
+        params=[chart_top_n],
+    ).fetchone()
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=df["patient_id"].to_list(),
+                y=df["observation_count"].to_list(),
+            )
+        ]
+    )
     fig.update_layout(
-        title="Observations per patient",
+        title=f"Observations per patient (top {chart_top_n})",
         xaxis_title="Patient",
+        xaxis_showticklabels=False,
         yaxis_title="Observation count",
         bargap=0.05,
         height=360,
     )
+    if other_patients:
+        fig.add_annotation(
+            text=(
+                f"Not shown: {other_patients} other patients with "
+                f"{other_observations} observations in total"
+            ),
+            xref="paper",
+            yref="paper",
+            x=1,
+            y=1,
+            xanchor="right",
+            yanchor="bottom",
+            showarrow=False,
+        )
 
     mo.ui.plotly(fig)
-    return (df,)
+    return
 
 
 @app.cell
-def _(df):
-    observation_counts = df["observation_count"]
-    first_20_percent = len(observation_counts) // 5
-
-    top_20_percet_observations = sum(observation_counts[:first_20_percent])
-    last_80_percent_observations = sum(observation_counts[first_20_percent:])
+def _(Schema, con):
+    # Split observations between the 20 % most active patients and the rest
+    top_20_percet_observations, last_80_percent_observations = con.sql(
+        f"""
+        WITH ranked AS (
+            SELECT
+                observation_count,
+                row_number() OVER (ORDER BY observation_count DESC) AS rank,
+                count(*) OVER () AS patients
+            FROM {Schema.GOLD}.observations_per_patient
+        )
+        SELECT
+            coalesce(sum(observation_count) FILTER (WHERE rank <= patients // 5), 0),
+            coalesce(sum(observation_count) FILTER (WHERE rank > patients // 5), 0)
+        FROM ranked
+        """
+    ).fetchone()
 
     # Tests if most of the observations are caused by the 20 % most active patients
     assert top_20_percet_observations > last_80_percent_observations, (
@@ -5,12 +5,21 @@ from .etl_reporting import (
     print_gold_summary,
     print_silver_summary,
 )
-from .validation_reports import get_validation_report, get_validation_summary
+from .validation_reports import (
+    build_validation_counts,
+    build_validation_summary,
+    get_validation_report,
+    get_validation_summary,
+    to_validation_report,
+)
 
 __all__ = [
+    "build_validation_counts",
+    "build_validation_summary",
     "get_validation_report",
     "get_validation_summary",
     "print_bronze_summary",
     "print_gold_summary",
     "print_silver_summary",
+    "to_validation_report",
 ]
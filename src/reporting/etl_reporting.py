@@ -1,49 +1,64 @@
 """ETL reporting helpers for CLI output."""
 
+import sys
 from typing import Any
 
 import polars as pl
 
 from src.reporting.models_summaries import (
-    get_condition_summary,
-    get_observation_summary,
-    get_patient_summary,
+    build_condition_summary,
+    build_observation_summary,
+    build_patient_summary,
 )
-from src.reporting.validation_reports import get_validation_report
+from src.reporting.validation_reports import (
+    build_validation_counts,
+    build_validation_summary,
+    to_validation_report,
+)
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write report lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_bronze_summary(summary: dict[str, int]) -> None:
     """Print bronze table counts."""
     total_resources = sum(summary.values())
 
-    print(f"Loaded {len(summary)} resource types ({total_resources} total resources)")
-    print()
-    print("Bronze tables:")
-    for table_name, count in summary.items():
-        print(f"  {table_name}: {count}")
+    lines = [
+        f"Loaded {len(summary)} resource types ({total_resources} total resources)",
+        "",
+        "Bronze tables:",
+    ]
+    lines.extend(f"  {table_name}: {count}" for table_name, count in summary.items())
+    _write_lines(lines)
 
 
-def _print_quality(title: str, summary: dict[str, int], total_key: str) -> None:
+def _quality_lines(title: str, summary: dict[str, int], total_key: str) -> list[str]:
     total = summary.get(total_key, 0)
-    print()
-    print(f"{title} data quality:")
+    lines = ["", f"{title} data quality:"]
     for field, count in summary.items():
         if field == total_key:
             continue
         pct = (count / total * 100) if total else 0
-        print(f"  {field}: {count} ({pct:.0f}%)")
-
-
-def _print_validation(title: str, report: dict[str, Any]) -> None:
-    print()
-    print(f"{title} validation results:")
-    print(f"  Valid: {report['valid_records']}")
-    print(f"  Invalid: {report['invalid_records']}")
-    print(f"  Validity rate: {report['validity_rate']:.1%}")
+        lines.append(f"  {field}: {count} ({pct:.0f}%)")
+    return lines
+
+
+def _validation_lines(title: str, report: dict[str, Any]) -> list[str]:
+    lines = [
+        "",
+        f"{title} validation results:",
+        f"  Valid: {report['valid_records']}",
+        f"  Invalid: {report['invalid_records']}",
+        f"  Validity rate: {report['validity_rate']:.1%}",
+    ]
     if report["errors_by_rule"]:
-        print("  Errors by rule:")
+        lines.append("  Errors by rule:")
         for err in report["errors_by_rule"]:
-            print(f"    {err['error']}: {err['count']}")
+            lines.append(f"    {err['error']}: {err['count']}")
+    return lines
 
 
 def print_silver_summary(
@@ -52,35 +67,67 @@ def print_silver_summary(
     observation_lf: pl.LazyFrame,
 ) -> None:
     """Print silver layer counts, quality, and validation summaries."""
-    patient_summary = get_patient_summary(patient_lf)
-    condition_summary = get_condition_summary(condition_lf)
-    observation_summary = get_observation_summary(observation_lf)
-
-    patient_report = get_validation_report(patient_lf)
-    condition_report = get_validation_report(condition_lf)
-    observation_report = get_validation_report(observation_lf)
-
-    print()
-    print("Silver layer (in-memory):")
-    print(f"  patient: {patient_summary['total_patients']}")
-    print(f"  condition: {condition_summary['total_conditions']}")
-    print(f"  observation: {observation_summary['total_observations']}")
-
-    _print_quality("Patient", patient_summary, "total_patients")
-    _print_validation("Patient", patient_report)
-
-    _print_quality("Condition", condition_summary, "total_conditions")
-    _print_validation("Condition", condition_report)
-
-    _print_quality("Observation", observation_summary, "total_observations")
-    _print_validation("Observation", observation_report)
-
-
-def print_gold_summary(observations_per_patient_lf: pl.LazyFrame) -> None:
+    # Collect all summary and validation queries in one pass over the inputs
+    (
+        patient_summary_df,
+        patient_counts_df,
+        patient_errors_df,
+        condition_summary_df,
+        condition_counts_df,
+        condition_errors_df,
+        observation_summary_df,
+        observation_counts_df,
+        observation_errors_df,
+    ) = pl.collect_all(
+        [
+            build_patient_summary(patient_lf),
+            build_validation_counts(patient_lf),
+            build_validation_summary(patient_lf),
+            build_condition_summary(condition_lf),
+            build_validation_counts(condition_lf),
+            build_validation_summary(condition_lf),
+            build_observation_summary(observation_lf),
+            build_validation_counts(observation_lf),
+            build_validation_summary(observation_lf),
+        ]
+    )
+
+    patient_summary = patient_summary_df.to_dicts()[0]
+    condition_summary = condition_summary_df.to_dicts()[0]
+    observation_summary = observation_summary_df.to_dicts()[0]
+
+    patient_report = to_validation_report(patient_counts_df, patient_errors_df)
+    condition_report = to_validation_report(condition_counts_df, condition_errors_df)
+    observation_report = to_validation_report(
+        observation_counts_df, observation_errors_df
+    )
+
+    lines = [
+        "",
+        "Silver layer (in-memory):",
+        f"  patient: {patient_summary['total_patients']}",
+        f"  condition: {condition_summary['total_conditions']}",
+        f"  observation: {observation_summary['total_observations']}",
+    ]
+
+    lines += _quality_lines("Patient", patient_summary, "total_patients")
+    lines += _validation_lines("Patient", patient_report)
+
+    lines += _quality_lines("Condition", condition_summary, "total_conditions")
+    lines += _validation_lines("Condition", condition_report)
+
+    lines += _quality_lines("Observation", observation_summary, "total_observations")
+    lines += _validation_lines("Observation", observation_report)
+
+    _write_lines(lines)
+
+
+def print_gold_summary(observations_per_patient: int) -> None:
     """Print gold table counts."""
-    observations_per_patient = observations_per_patient_lf.select(
-        pl.len().alias("total")
-    ).collect()["total"][0]
-    print()
-    print("Gold tables:")
-    print(f"  observations_per_patient: {observations_per_patient}")
+    _write_lines(
+        [
+            "",
+            "Gold tables:",
+            f"  observations_per_patient: {observations_per_patient}",
+        ]
+    )
@@ -11,8 +11,10 @@ def _as_lazyframe(validated_lf: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
     return validated_lf
 
 
-def get_validation_summary(validated_lf: pl.LazyFrame | pl.DataFrame) -> pl.DataFrame:
-    """Get summary of validation errors."""
+def build_validation_summary(
+    validated_lf: pl.LazyFrame | pl.DataFrame,
+) -> pl.LazyFrame:
+    """Build the lazy query counting validation errors per rule."""
     return (
         _as_lazyframe(validated_lf)
         .select(pl.col("validation_errors").list.explode().alias("error"))
@@ -20,22 +22,30 @@ def get_validation_summary(validated_lf: pl.LazyFrame | pl.DataFrame) -> pl.Data
         .group_by("error")
         .agg(pl.len().alias("count"))
         .sort("count", descending=True)
-        .collect()
     )
 
 
-def get_validation_report(validated_lf: pl.LazyFrame | pl.DataFrame) -> dict[str, Any]:
-    """Generate a validation report."""
-    if isinstance(validated_lf, pl.DataFrame):
-        df = validated_lf
-    else:
-        df = validated_lf.collect()
+def build_validation_counts(validated_lf: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
+    """Build the lazy query counting total and valid records."""
+    return _as_lazyframe(validated_lf).select(
+        pl.len().alias("total_records"),
+        (pl.col("validation_errors").list.len() == 0).sum().alias("valid_records"),
+    )
 
-    total = len(df)
-    valid = df.filter(pl.col("validation_errors").list.len() == 0).height
-    invalid = total - valid
 
-    error_summary = get_validation_summary(validated_lf)
+def get_validation_summary(validated_lf: pl.LazyFrame | pl.DataFrame) -> pl.DataFrame:
+    """Get summary of validation errors."""
+    return build_validation_summary(validated_lf).collect()
+
+
+def to_validation_report(
+    counts_df: pl.DataFrame, error_summary: pl.DataFrame
+) -> dict[str, Any]:
+    """Combine collected validation counts and error summary into a report."""
+    counts = counts_df.row(0, named=True)
+    total = counts["total_records"]
+    valid = counts["valid_records"]
+    invalid = total - valid
 
     return {
         "total_records": total,
@@ -44,3 +54,12 @@ def get_validation_report(validated_lf: pl.LazyFrame | pl.DataFrame) -> dict[str
         "validity_rate": valid / total if total > 0 else 0.0,
         "errors_by_rule": error_summary.to_dicts(),
     }
+
+
+def get_validation_report(validated_lf: pl.LazyFrame | pl.DataFrame) -> dict[str, Any]:
+    """Generate a validation report."""
+    # Both aggregations share the validated input, so run them in one pass
+    counts_df, error_summary = pl.collect_all(
+        [build_validation_counts(validated_lf), build_validation_summary(validated_lf)]
+    )
+    return to_validation_report(counts_df, error_summary)
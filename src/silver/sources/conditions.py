@@ -37,6 +37,21 @@ _SOURCES_SCHEMA = {
     "asserter_display": pl.String,
 }
 
+# Bronze columns read by `_transform_row`; other FHIR fields are not loaded
+BRONZE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "_source_file",
+    "_source_bundle",
+    "subject",
+    "category",
+    "code",
+    "onsetDateTime",
+    "_onsetDateTime",
+    "abatementDateTime",
+    "_abatementDateTime",
+    "asserter",
+)
+
 
 def extract_patient_id(subject: dict[str, Any] | None) -> str | None:
     """Extract patient ID from subject reference."""
@@ -155,7 +170,6 @@ def get_condition(bronze_df: pl.DataFrame) -> pl.LazyFrame:
 
     Returns a flat sources LazyFrame with stable, known columns.
     """
-    rows = bronze_df.to_dicts()
-    source_rows = [_transform_row(row) for row in rows]
+    source_rows = [_transform_row(row) for row in bronze_df.iter_rows(named=True)]
     sources_df = pl.from_dicts(source_rows, schema=_SOURCES_SCHEMA)
     return sources_df.lazy()
@@ -28,6 +28,38 @@ from src.common.models import OBSERVATION_SCHEMA
 _SOURCES_SCHEMA = dict(OBSERVATION_SCHEMA)
 _SOURCES_SCHEMA.pop("validation_errors", None)
 
+# Bronze columns read by `_transform_row`; other FHIR fields are not loaded
+BRONZE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "_source_file",
+    "_source_bundle",
+    "status",
+    "subject",
+    "effectiveDateTime",
+    "effectiveInstant",
+    "effectiveTime",
+    "effectivePeriod",
+    "issued",
+    "category",
+    "code",
+    "performer",
+    "component",
+    "valueQuantity",
+    "valueCodeableConcept",
+    "valueString",
+    "valueBoolean",
+    "valueInteger",
+    "valueDateTime",
+)
+
+# value[x] keys checked after Quantity and CodeableConcept, in priority order
+_SCALAR_VALUE_TYPES: tuple[tuple[str, str], ...] = (
+    ("valueString", ObservationValueType.STRING),
+    ("valueBoolean", ObservationValueType.BOOLEAN),
+    ("valueInteger", ObservationValueType.INTEGER),
+    ("valueDateTime", ObservationValueType.DATETIME),
+)
+
 
 # =============================================================================
 # Column extraction functions - focused functions for extracting specific fields
@@ -63,13 +95,7 @@ def detect_value_type(value_obj: dict[str, Any]) -> str | None:
     if isinstance(value_cc, dict):
         return ObservationValueType.CODEABLE_CONCEPT
 
-    type_mapping = (
-        ("valueString", ObservationValueType.STRING),
-        ("valueBoolean", ObservationValueType.BOOLEAN),
-        ("valueInteger", ObservationValueType.INTEGER),
-        ("valueDateTime", ObservationValueType.DATETIME),
-    )
-    for key, vtype in type_mapping:
+    for key, vtype in _SCALAR_VALUE_TYPES:
         if value_obj.get(key) is not None:
             return vtype
     return None
@@ -274,7 +300,6 @@ def get_observation(bronze_df: pl.DataFrame) -> pl.LazyFrame:
 
     Returns a flat sources LazyFrame with stable, known columns.
     """
-    rows = bronze_df.to_dicts()
-    source_rows = [_transform_row(row) for row in rows]
+    source_rows = [_transform_row(row) for row in bronze_df.iter_rows(named=True)]
     sources_df = pl.from_dicts(source_rows, schema=_SOURCES_SCHEMA)
     return sources_df.lazy()
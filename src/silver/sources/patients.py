@@ -18,8 +18,8 @@ from src.common.fhir import (
     extract_address_field,
     extract_extension_value,
     extract_from_name_list,
-    extract_identifier,
     extract_telecom,
+    index_by_field,
 )
 
 _SOURCES_SCHEMA = {
@@ -41,6 +41,20 @@ _SOURCES_SCHEMA = {
     "identifier_mr": pl.String,
 }
 
+# Bronze columns read by `_transform_row`; other FHIR fields are not loaded
+BRONZE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "_source_file",
+    "_source_bundle",
+    "name",
+    "birthDate",
+    "gender",
+    "telecom",
+    "address",
+    "extension",
+    "identifier",
+)
+
 
 def extract_family_name(name_list: list[dict] | None) -> str | None:
     """Extract family name from FHIR name array."""
@@ -101,23 +115,14 @@ def extract_nationality_code(extension_list: list[dict] | None) -> str | None:
     return None
 
 
-def extract_identifier_eci(identifier_list: list[dict] | None) -> str | None:
-    """Extract ECI identifier from FHIR identifier array."""
-    return extract_identifier(identifier_list, IdentifierSystem.ECI)
-
-
-def extract_identifier_mr(identifier_list: list[dict] | None) -> str | None:
-    """Extract MR identifier from FHIR identifier array."""
-    return extract_identifier(identifier_list, IdentifierSystem.MR)
-
-
 def _transform_row(row: dict[str, Any]) -> dict[str, Any]:
     """Transform a single bronze patient row to a flat sources row."""
     name_list = row.get("name")
     telecom_list = row.get("telecom")
     address_list = row.get("address")
     extension_list = row.get("extension")
-    identifier_list = row.get("identifier")
+    # One pass over identifiers serves every system looked up below
+    identifiers = index_by_field(row.get("identifier"), "system", "value")
 
     return {
         "id": row.get("id"),
@@ -134,8 +139,8 @@ def _transform_row(row: dict[str, Any]) -> dict[str, Any]:
         "postal_code": extract_postal_code(address_list),
         "country": extract_country(address_list),
         "nationality_code": extract_nationality_code(extension_list),
-        "identifier_eci": extract_identifier_eci(identifier_list),
-        "identifier_mr": extract_identifier_mr(identifier_list),
+        "identifier_eci": identifiers.get(IdentifierSystem.ECI),
+        "identifier_mr": identifiers.get(IdentifierSystem.MR),
     }
 
 
@@ -144,7 +149,6 @@ def get_patient(bronze_df: pl.DataFrame) -> pl.LazyFrame:
 
     Returns a flat sources LazyFrame with stable, known columns.
     """
-    rows = bronze_df.to_dicts()
-    source_rows = [_transform_row(row) for row in rows]
+    source_rows = [_transform_row(row) for row in bronze_df.iter_rows(named=True)]
     sources_df = pl.from_dicts(source_rows, schema=_SOURCES_SCHEMA)
     return sources_df.lazy()
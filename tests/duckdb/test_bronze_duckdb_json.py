@@ -0,0 +1,106 @@
+"""Tests for loading bronze tables with DuckDB's JSON reader."""
+
+import json
+from pathlib import Path
+
+import duckdb
+
+from src.bronze import load_bronze_bundles
+from src.bronze.duckdb_json import load_bronze_tables_with_duckdb
+from src.constants import Schema
+from src.db.duckdb_io import list_tables, write_dataframes
+
+BUNDLES = [
+    {
+        "resourceType": "Bundle",
+        "id": "bundle-1",
+        "entry": [
+            {
+                "fullUrl": "urn:uuid:p1",
+                "resource": {
+                    "resourceType": "Patient",
+                    "id": "p1",
+                    "gender": "female",
+                },
+            },
+            {
+                "fullUrl": "urn:uuid:o1",
+                "resource": {
+                    "resourceType": "Observation",
+                    "id": "o1",
+                    "status": "final",
+                },
+            },
+            {
+                "fullUrl": "urn:uuid:o2",
+                "resource": {"resourceType": "Observation", "id": "o2"},
+            },
+        ],
+    },
+    {
+        "resourceType": "Bundle",
+        "id": "bundle-2",
+        "entry": [
+            {
+                "fullUrl": "urn:uuid:p2",
+                "resource": {
+                    "resourceType": "Patient",
+                    "id": "p2",
+                    "birthDate": "1990-01-01",
+                },
+            },
+            {
+                "fullUrl": "urn:uuid:c1",
+                "resource": {"resourceType": "Condition", "id": "c1"},
+            },
+        ],
+    },
+]
+
+
+def _write_bundles(bundle_dir: Path) -> None:
+    for bundle in BUNDLES:
+        (bundle_dir / f"{bundle['id']}.json").write_text(json.dumps(bundle))
+
+
+def _metadata_rows(con: duckdb.DuckDBPyConnection, table: str) -> list[tuple]:
+    return con.execute(
+        f"""
+        SELECT id, _source_file, _source_bundle, _full_url
+        FROM {Schema.BRONZE}.{table}
+        ORDER BY id
+        """
+    ).fetchall()
+
+
+def test_duckdb_json_loader_matches_python_loader(tmp_path: Path) -> None:
+    """Both bronze loaders produce the same tables, row counts and metadata."""
+    _write_bundles(tmp_path)
+
+    python_con = duckdb.connect(":memory:")
+    frames = load_bronze_bundles(tmp_path)
+    write_dataframes(python_con, Schema.BRONZE, frames)
+
+    duckdb_con = duckdb.connect(":memory:")
+    row_counts = load_bronze_tables_with_duckdb(tmp_path, duckdb_con)
+
+    tables = list_tables(python_con, Schema.BRONZE)
+    assert tables == ["condition", "observation", "patient"]
+    assert list_tables(duckdb_con, Schema.BRONZE) == tables
+    assert row_counts == {table: df.height for table, df in frames.items()}
+    for table in tables:
+        assert _metadata_rows(duckdb_con, table) == _metadata_rows(python_con, table)
+
+    assert _metadata_rows(duckdb_con, "observation") == [
+        ("o1", "bundle-1.json", "bundle-1", "urn:uuid:o1"),
+        ("o2", "bundle-1.json", "bundle-1", "urn:uuid:o2"),
+    ]
+
+
+def test_duckdb_json_loader_empty_directory(tmp_path: Path) -> None:
+    """Like the Python loader, an empty directory loads no tables."""
+    con = duckdb.connect(":memory:")
+
+    assert load_bronze_bundles(tmp_path) == {}
+    assert load_bronze_tables_with_duckdb(tmp_path, con) == {}
+    assert list_tables(con, Schema.BRONZE) == []
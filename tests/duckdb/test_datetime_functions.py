@@ -0,0 +1,53 @@
+from datetime import date
+
+import duckdb
+
+from das.engine.duckdb.functions.common import Col
+from das.engine.duckdb.functions.datetime import datediff, timestamp_to_date
+
+
+def test_timestamp_to_date_with_format_nulls_malformed_values():
+    rel = duckdb.sql(
+        "SELECT * FROM (VALUES (1, '2024-01-31 10:15'), (2, 'not a date')) t(id, ts)"
+    )
+    result = rel.select(
+        Col("id"), timestamp_to_date(Col("ts"), "%Y-%m-%d %H:%M")
+    ).order("id")
+    assert result.fetchall() == [(1, date(2024, 1, 31)), (2, None)]
+
+
+def _datediff_with_ignored(start: str, end: str, ignored: str) -> list[tuple]:
+    rel = duckdb.sql(
+        f"SELECT {start}::DATE AS start_date, {end}::DATE AS end_date,"
+        f" {ignored}::DATE[] AS ignored"
+    )
+    return rel.select(
+        datediff(Col("start_date"), Col("end_date"), Col("ignored"))
+    ).fetchall()
+
+
+def test_datediff_counts_duplicate_ignored_days_once():
+    result = _datediff_with_ignored(
+        "'2024-01-01'", "'2024-01-05'", "['2024-01-02', '2024-01-02', '2024-01-03']"
+    )
+    assert result == [(2,)]
+
+
+def test_datediff_start_after_end_is_zero():
+    result = _datediff_with_ignored("'2024-01-05'", "'2024-01-01'", "['2024-01-03']")
+    assert result == [(0,)]
+
+
+def test_datediff_null_end_date_is_null():
+    result = _datediff_with_ignored("'2024-01-01'", "NULL", "['2024-01-03']")
+    assert result == [(None,)]
+
+
+def test_datediff_null_start_date_is_null():
+    result = _datediff_with_ignored("NULL", "'2024-01-05'", "['2024-01-03']")
+    assert result == [(None,)]
+
+
+def test_datediff_null_ignore_list_ignores_nothing():
+    result = _datediff_with_ignored("'2024-01-01'", "'2024-01-05'", "NULL")
+    assert result == [(4,)]
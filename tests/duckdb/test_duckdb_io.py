@@ -0,0 +1,19 @@
+import duckdb
+import polars as pl
+
+from src.constants import Schema
+from src.db.duckdb_io import write_dataframe
+
+
+def test_write_dataframe_ignores_catalog_table_named_df() -> None:
+    """A catalog table called `df` must not shadow the frame being written."""
+    con = duckdb.connect(":memory:")
+    con.execute("CREATE TABLE df AS SELECT 42 AS x")
+
+    row_count = write_dataframe(con, Schema.BRONZE, "t", pl.DataFrame({"x": [1, 2]}))
+
+    assert row_count == 2
+    assert con.execute(f"SELECT x FROM {Schema.BRONZE}.t ORDER BY x").fetchall() == [
+        (1,),
+        (2,),
+    ]
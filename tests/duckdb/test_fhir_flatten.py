@@ -234,7 +234,7 @@ class TestRealEpsData:
         write_dataframes(con, Schema.BRONZE, frames)
 
         # Verify tables created
-        summary = get_table_summary(con, Schema.BRONZE)
+        summary = get_table_summary(con, Schema.BRONZE, exact=True)
         print(f"\nTables created: {list(summary.keys())}")
         print(f"Total resources: {sum(summary.values())}")
 
@@ -262,7 +262,7 @@ class TestRealEpsData:
         print(f"\nObservations per bundle (top 5):\n{obs_per_bundle.to_string()}")
 
         # 2. Resource type distribution
-        summary = get_table_summary(con, Schema.BRONZE)
+        summary = get_table_summary(con, Schema.BRONZE, exact=True)
         print("\nResource distribution:")
         for table_name, count in summary.items():
             print(f"  {table_name}: {count}")
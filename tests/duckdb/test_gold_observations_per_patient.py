@@ -12,8 +12,20 @@ from src.common.models import (
     Patient,
 )
 from src.constants import Schema
-from src.db.duckdb_io import write_lazyframe
-from src.gold import build_observations_per_patient
+from src.db.duckdb_io import write_dataframe, write_lazyframe
+from src.gold import (
+    build_observations_per_patient,
+    create_observations_per_patient_table,
+)
+
+
+def _pad_patients(patient_data: list[dict]) -> list[dict]:
+    """Add the remaining PATIENT_SCHEMA fields with empty values."""
+    for row in patient_data:
+        for key in PATIENT_SCHEMA:
+            if key not in row:
+                row[key] = None if key != "validation_errors" else []
+    return patient_data
 
 
 def test_build_observations_per_patient_counts_and_age() -> None:
@@ -24,13 +36,7 @@ def test_build_observations_per_patient_counts_and_age() -> None:
         {"id": "p2", "birth_date": None},
         {"id": "p3", "birth_date": "not-a-date"},
     ]
-    # Add required fields with None values
-    for row in patient_data:
-        for key in PATIENT_SCHEMA:
-            if key not in row:
-                row[key] = None if key != "validation_errors" else []
-
-    patient_lf = Patient.from_dicts(patient_data, PATIENT_SCHEMA)
+    patient_lf = Patient.from_dicts(_pad_patients(patient_data), PATIENT_SCHEMA)
 
     # Create observation LazyFrame
     observation_data = [
@@ -77,6 +83,28 @@ def test_build_observations_per_patient_counts_and_age() -> None:
     assert result["patient_age_years"].to_list() == [25, None, None]
 
 
+def test_build_observations_per_patient_age_before_birthday() -> None:
+    """Test that age counts completed years, not elapsed days / 365."""
+    patient_data = [
+        {"id": "p1", "birth_date": "2000-06-15"},
+        {"id": "p2", "birth_date": "2000-06-16"},
+    ]
+    patient_lf = Patient.from_dicts(_pad_patients(patient_data), PATIENT_SCHEMA)
+    observation_lf = Observation.from_df(
+        pl.DataFrame(schema=OBSERVATION_SCHEMA).lazy(), validate=False
+    )
+
+    result = (
+        build_observations_per_patient(
+            patient_lf, observation_lf, as_of=date(2025, 6, 15)
+        )
+        .collect()
+        .sort("patient_id")
+    )
+
+    assert result["patient_age_years"].to_list() == [25, 24]
+
+
 def test_save_observations_per_patient_to_db() -> None:
     """Test that gold LazyFrame is saved to DuckDB correctly."""
     con = duckdb.connect(":memory:")
@@ -108,3 +136,65 @@ def test_save_observations_per_patient_to_db() -> None:
         ("p1", 5, date(2000, 1, 1), 25),
         ("p2", 3, None, None),
     ]
+
+
+def test_create_observations_per_patient_table_from_silver() -> None:
+    """Test that the SQL gold path matches the Polars aggregation."""
+    con = duckdb.connect(":memory:")
+    for schema in (Schema.SILVER, Schema.GOLD):
+        con.execute(f"CREATE SCHEMA {schema}")
+    con.execute("CREATE TABLE silver.patient (id VARCHAR, birth_date VARCHAR)")
+    con.execute(
+        "INSERT INTO silver.patient VALUES "
+        "('p1', '2000-01-01'), ('p2', NULL), ('p3', 'not-a-date')"
+    )
+    con.execute("CREATE TABLE silver.observation (id VARCHAR, subject_id VARCHAR)")
+    con.execute(
+        "INSERT INTO silver.observation VALUES "
+        "('o1', 'p1'), ('o2', 'p1'), ('o3', 'p1'), ('o4', 'p2'), "
+        "('o5', 'unknown'), ('o6', NULL)"
+    )
+
+    row_count = create_observations_per_patient_table(con, as_of=date(2025, 1, 1))
+
+    rows = con.execute(
+        """
+        SELECT patient_id, observation_count, birth_date, patient_age_years
+        FROM gold.observations_per_patient
+        ORDER BY patient_id
+        """
+    ).fetchall()
+
+    assert row_count == 3
+    assert rows == [
+        ("p1", 3, date(2000, 1, 1), 25),
+        ("p2", 1, None, None),
+        ("p3", 0, None, None),
+    ]
+
+    # Column types match the Polars build written from the same silver tables
+    polars_gold_df = build_observations_per_patient(
+        Patient.from_df(
+            con.sql("SELECT * FROM silver.patient").pl().lazy(), validate=False
+        ),
+        Observation.from_df(
+            con.sql("SELECT * FROM silver.observation").pl().lazy(), validate=False
+        ),
+        as_of=date(2025, 1, 1),
+    ).collect()
+    write_dataframe(con, Schema.GOLD, "polars_observations_per_patient", polars_gold_df)
+
+    def column_types(table: str) -> list[tuple[str, str]]:
+        return con.execute(
+            f"SELECT column_name, column_type FROM (DESCRIBE {Schema.GOLD}.{table})"
+        ).fetchall()
+
+    assert column_types("observations_per_patient") == [
+        ("patient_id", "VARCHAR"),
+        ("observation_count", "UINTEGER"),
+        ("birth_date", "DATE"),
+        ("patient_age_years", "INTEGER"),
+    ]
+    assert column_types("polars_observations_per_patient") == column_types(
+        "observations_per_patient"
+    )
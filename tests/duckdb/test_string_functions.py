@@ -0,0 +1,20 @@
+import duckdb
+
+from das.engine.duckdb.functions.common import Col
+from das.engine.duckdb.functions.string import normalize_municipality_name
+
+
+def test_normalize_municipality_name():
+    rel = duckdb.sql(
+        "SELECT * FROM (VALUES (1, 'MÄNTTÄ-VILPPULA'), (2, 'turku'), (3, 'hELSINKI'),"
+        " (4, NULL)) t(id, municipality)"
+    )
+    result = rel.select(
+        Col("id"), normalize_municipality_name(Col("municipality"))
+    ).order("id")
+    assert result.fetchall() == [
+        (1, "Mänttä-Vilppula"),
+        (2, "Turku"),
+        (3, "Helsinki"),
+        (4, None),
+    ]
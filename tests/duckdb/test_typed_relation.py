@@ -1,3 +1,7 @@
+import importlib
+
+import pytest
+
 from das.engine.duckdb.typed_relation import Col, TypedRelation
 
 
@@ -55,3 +59,23 @@ def test_self_join():
     )
     joined = point1.join(point2, "x", how="inner")
     assert joined.count("*").fetchall() == [(3 * 3,)]
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "das.engine.duckdb.typed_relation",
+        "das.common.engine.duckdb.dataframe.typed_relation",
+        "das.common.duckdb.dataframe.typed_relation",
+    ],
+)
+def test_from_dicts_unions_keys_across_rows(module):
+    typed_relation = importlib.import_module(module)
+
+    class Shape(typed_relation.TypedRelation):
+        x: typed_relation.Col[int | None]
+        color: typed_relation.Col[str | None]
+
+    shape = Shape.from_dicts([{"x": 0}, {"x": 1, "color": "red"}])
+    assert sorted(shape.columns) == ["color", "x"]
+    assert shape.select("x, color").order("x").fetchall() == [(0, None), (1, "red")]
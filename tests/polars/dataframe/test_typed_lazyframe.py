@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import polars as pl
 import pytest
 
@@ -162,3 +165,13 @@ def test_validation_can_be_skipped():
     # Should not raise when validate=False
     point = Point.from_df(df, validate=False)
     assert point is not None
+
+
+def test_dynamic_schema_class_can_be_garbage_collected():
+    class Temporary(TypedLazyFrame):
+        value: Col[int | None]
+
+    temporary_ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert temporary_ref() is None